@@ -1,21 +1,37 @@
 import re
-from bs4 import BeautifulSoup
+from selectolax.parser import HTMLParser
 from dateutil.parser import parse as dtparse
 
 
+import asyncio
+import functools
+import hashlib
 import os
 import sys
 from dataclasses import dataclass
+from operator import itemgetter
 from datetime import datetime, date, time, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 
 import yaml
-import requests
+
+try:
+    # Loader en C (libyaml): 10-20x más rápido que el puro Python
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+import httpx
 from dateutil import tz
 
+# Zona horaria de referencia: se resuelve una vez al importar.
+MADRID_TZ = tz.gettz("Europe/Madrid")
+
 
 # ---------- Modelos ----------
-@dataclass
+# slots: sin __dict__ por instancia (menos memoria, atributos más rápidos).
+# frozen: hashables, así podemos deduplicar eventos con un set/dict.
+@dataclass(slots=True, frozen=True)
 class VenueSource:
     name: str
     city: str
@@ -24,7 +40,16 @@ class VenueSource:
     notes: str = ""
 
 
-@dataclass
+# Miles de eventos repiten venue/URL: internamos para que todos apunten
+# a la misma copia del string en vez de arrastrar duplicados.
+_INTERN: Dict[str, str] = {}
+
+
+def _i(s: str) -> str:
+    return _INTERN.setdefault(s, sys.intern(s))
+
+
+@dataclass(slots=True, frozen=True)
 class Event:
     title: str
     venue: str
@@ -44,15 +69,23 @@ DANCE_KEYWORDS = [
     "baile", "dance", "fiesta", "dj set", "jam"
 ]
 
+# Una sola pasada sobre el texto en vez de un `in` por keyword:
+# re compila la alternancia a un autómata interno (estilo trie).
+# Las largas primero, para que "jazz-funk" no se quede en "jazz".
+# IGNORECASE: el case-folding lo hace el matcher, sin copia .lower()
+# del título por llamada.
+DANCE_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(DANCE_KEYWORDS, key=len, reverse=True)),
+    re.IGNORECASE,
+)
 
-# ---------- Utilidades ----------
-def load_venues(path: str = "venues.yaml") -> List[VenueSource]:
-    """Lee venues.yaml y devuelve una lista de fuentes."""
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"No existe {path}. ¿Lo has creado en la raíz del repo?")
 
+# ---------- Utilidades ----------
+@functools.lru_cache(maxsize=1)
+def _load_venues_cached(path: str, mtime: float) -> List[VenueSource]:
+    """Parsea venues.yaml; 'mtime' solo invalida la caché si el fichero cambia."""
     with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
 
     venues_data = data.get("venues", [])
     venues: List[VenueSource] = []
@@ -69,6 +102,14 @@ def load_venues(path: str = "venues.yaml") -> List[VenueSource]:
     return venues
 
 
+def load_venues(path: str = "venues.yaml") -> List[VenueSource]:
+    """Lee venues.yaml y devuelve una lista de fuentes."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No existe {path}. ¿Lo has creado en la raíz del repo?")
+
+    return _load_venues_cached(path, os.path.getmtime(path))
+
+
 def madrid_weekend_window(today_madrid: date) -> Tuple[date, date]:
     """
     Devuelve (viernes, sábado) de la misma semana que 'today_madrid',
@@ -89,21 +130,54 @@ def madrid_weekend_window(today_madrid: date) -> Tuple[date, date]:
 
 def is_danceable(text: str) -> bool:
     """Filtro simple por palabras clave (lo refinaremos)."""
-    t = (text or "").lower()
-    return any(k in t for k in DANCE_KEYWORDS)
+    return DANCE_RE.search(text or "") is not None
+
+
+# Ojo: User-Agent propio para evitar bloqueos tontos.
+USER_AGENT = "Mozilla/5.0 (compatible; MadridConcertsBot/1.0; +https://github.com/)"
 
+# Un solo cliente async con HTTP/2: las descargas van concurrentes en
+# un único hilo y las peticiones al mismo origen se multiplexan.
+HTTP_LIMITS = httpx.Limits(max_connections=32)
 
-def fetch_html(url: str, timeout: int = 30) -> str:
+
+# Caché de HTML en disco: el script corre varias veces al día y las
+# agendas no cambian tan rápido. Clave = sha1(url) + fecha Madrid.
+CACHE_DIR = "cache"
+CACHE_MAX_AGE_S = 6 * 3600  # 6 horas
+
+
+def _cache_path(url: str) -> str:
+    stamp = datetime.now(tz=MADRID_TZ).strftime("%Y%m%d")
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}-{stamp}.html")
+
+
+async def fetch_html(client: httpx.AsyncClient, url: str, timeout: int = 30) -> str:
     """
-    Descarga HTML de una web de agenda.
-    Ojo: añadimos User-Agent para evitar bloqueos tontos.
+    Descarga HTML de una web de agenda, con caché en disco (<6h) para
+    no re-scrapear lo mismo en ejecuciones repetidas del mismo día.
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (compatible; MadridConcertsBot/1.0; +https://github.com/)"
-    }
-    r = requests.get(url, headers=headers, timeout=timeout)
+    path = _cache_path(url)
+    try:
+        if datetime.now().timestamp() - os.path.getmtime(path) < CACHE_MAX_AGE_S:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+    except OSError:
+        pass  # no hay caché (o no se puede leer): descargamos
+
+    r = await client.get(url, timeout=timeout)
     r.raise_for_status()
-    return r.text
+    html = r.text
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(html)
+    except OSError:
+        pass  # la caché es best-effort: si no se puede escribir, seguimos
+
+    return html
 
 SPANISH_MONTHS = {
     "enero": 1, "febrero": 2, "marzo": 3, "abril": 4, "mayo": 5, "junio": 6,
@@ -113,6 +187,15 @@ SPANISH_MONTHS = {
     "jul": 7, "ago": 8, "sep": 9, "oct": 10, "nov": 11, "dic": 12,
 }
 
+# Quitar tildes en una sola pasada (sin encadenar .replace, que copia
+# el string entero cada vez).
+ACCENT_TBL = str.maketrans("áéíóúÁÉÍÓÚ", "aeiouAEIOU")
+
+# Formatos de fecha, compilados una vez al importar.
+_RE_DATE_WITH_YEAR = re.compile(r"\b(\d{1,2})\s+de\s+([a-záéíóú]+)\s+de\s+(\d{4})\b")  # 30 de enero de 2026
+_RE_DATE_NO_YEAR = re.compile(r"\b(\d{1,2})\s+([a-záéíóú]{3,})\b")  # 29 enero
+
+@functools.lru_cache(maxsize=512)
 def parse_spanish_date_str(s: str) -> Optional[date]:
     """
     Acepta strings tipo:
@@ -120,26 +203,26 @@ def parse_spanish_date_str(s: str) -> Optional[date]:
       - '30 de enero de 2026'
       - '28 ene'
     Devuelve date o None.
+    Memoizada: las agendas repiten los mismos strings de fecha una y otra vez.
     """
     if not s:
         return None
     t = s.strip().lower()
 
     # 30 de enero de 2026
-    m = re.search(r"\b(\d{1,2})\s+de\s+([a-záéíóú]+)\s+de\s+(\d{4})\b", t)
+    m = _RE_DATE_WITH_YEAR.search(t)
     if m:
         d = int(m.group(1))
-        mon = SPANISH_MONTHS.get(m.group(2).replace("á","a").replace("é","e").replace("í","i").replace("ó","o").replace("ú","u"))
+        mon = SPANISH_MONTHS.get(m.group(2).translate(ACCENT_TBL))
         y = int(m.group(3))
         if mon:
             return date(y, mon, d)
 
     # 29 enero  (sin año)
-    m = re.search(r"\b(\d{1,2})\s+([a-záéíóú]{3,})\b", t)
+    m = _RE_DATE_NO_YEAR.search(t)
     if m:
         d = int(m.group(1))
-        mon_key = m.group(2)
-        mon_key = mon_key.replace("á","a").replace("é","e").replace("í","i").replace("ó","o").replace("ú","u")
+        mon_key = m.group(2).translate(ACCENT_TBL)
         mon = SPANISH_MONTHS.get(mon_key)
         if mon:
             # año “probable”: lo decide el caller comparando con 'today'
@@ -165,8 +248,17 @@ def attach_year(d: date, today_madrid: date) -> date:
 
 
 
+# Bloque de agenda de Tempo Club: "29 enero | 21:00" y en la línea
+# no vacía siguiente, el título. Un solo finditer sobre todo el texto
+# en vez de iterar línea a línea en Python.
+_TEMPO_EVENT_RE = re.compile(
+    r"(?m)^[ \t]*(\d{1,2})[ \t]+([a-záéíóú]+)[ \t]*\|[ \t]*([0-2]?\d:\d{2})[ \t]*\n\s*(\S[^\n]*)",
+    re.IGNORECASE,
+)
+
+
 # ---------- “Parsers” por fuente (aún vacíos) ----------
-def parse_events_from_teatro_del_barrio(html: str, source: VenueSource) -> List[Event]:
+def parse_events_from_teatro_del_barrio(html: str, source: VenueSource, today_madrid: date) -> List[Event]:
     """
     TODO: implementar scraping real.
     Debe devolver lista de Event con fecha y link.
@@ -174,80 +266,131 @@ def parse_events_from_teatro_del_barrio(html: str, source: VenueSource) -> List[
     return []
 
 
-def parse_events_from_tempo_club(html: str, source: VenueSource) -> List[Event]:
-    soup = BeautifulSoup(html, "lxml")
-    text_lines = [ln.strip() for ln in soup.get_text("\n").splitlines() if ln.strip()]
+def _tempo_event_from_match(m: re.Match, url: str, source: VenueSource, today_madrid: date) -> Optional[Event]:
+    """Construye un Event desde un match de _TEMPO_EVENT_RE (o None si la fecha no parsea)."""
+    d0 = parse_spanish_date_str(f"{int(m.group(1))} {m.group(2)}")
+    if not d0:
+        return None
+    # año placeholder 1900 -> año real con el 'hoy' Madrid que nos pasa el caller
+    title = m.group(4).strip()
+    return Event(
+        title=title,
+        venue=_i(source.name),
+        event_date=attach_year(d0, today_madrid),
+        event_time=m.group(3),
+        url=_i(url),
+        source_url=_i(source.url),
+        raw_genre_text=title,
+    )
+
+
+# Tarjetas de evento típicas de la agenda; si la maqueta no las trae
+# (o no sacamos nada de ellas), caemos al barrido del texto completo.
+_TEMPO_CARD_SELECTOR = ".event, .evento, article"
+def _contains_tempo_card(card) -> bool:
+    """True si la tarjeta envuelve otras tarjetas (node.css incluye al propio nodo)."""
+    return len(card.css(_TEMPO_CARD_SELECTOR)) > 1
+
+
+def _tempo_info_links(node) -> List[str]:
+    """hrefs de los links '+ info' bajo 'node', en orden de aparición."""
+    links: List[str] = []
+    for a in node.css("a"):
+        label = (a.text(separator=" ", strip=True) or "").lower()
+        href = a.attributes.get("href") or ""
+        if "+ info" in label and href:
+            links.append(href)
+    return links
+
+
+def _tempo_card_url(card) -> Optional[str]:
+    """URL del evento dentro de una tarjeta: el link '+ info' si lo hay, si no el primero."""
+    first_href = None
+    for a in card.css("a"):
+        href = a.attributes.get("href") or ""
+        if not href:
+            continue
+        if "+ info" in (a.text(separator=" ", strip=True) or "").lower():
+            return href
+        if first_href is None:
+            first_href = href
+    return first_href
+
 
+def parse_events_from_tempo_club(html: str, source: VenueSource, today_madrid: date) -> List[Event]:
+    tree = HTMLParser(html)
+    events: List[Event] = []
+
+    # Vía rápida: iterar las tarjetas de evento y leer solo su texto
+    # (coste O(eventos), no O(documento); cada tarjeta trae su propio link).
+    for card in tree.css(_TEMPO_CARD_SELECTOR):
+        # Tarjetas anidadas (un article que envuelve .evento): saltamos el
+        # wrapper para no emitir cada evento dos veces; las interiores son
+        # más precisas y traen su propio link.
+        if _contains_tempo_card(card):
+            continue
+
+        # finditer, no search: un wrapper puede contener varios bloques
+        # de agenda y queremos todos, no solo el primero.
+        matches = list(_TEMPO_EVENT_RE.finditer(card.text(separator="\n")))
+        if not matches:
+            continue
+
+        card_links = _tempo_info_links(card)
+        for idx, m in enumerate(matches):
+            if idx < len(card_links):
+                url = card_links[idx]
+            elif len(matches) == 1:
+                url = _tempo_card_url(card) or source.url
+            else:
+                url = source.url
+            ev = _tempo_event_from_match(m, url, source, today_madrid)
+            if ev:
+                events.append(ev)
+    # Ojo: 'article' también envuelve contenido que no es agenda (blogs,
+    # avisos); si las tarjetas no dieron ningún evento, no nos fiamos y
+    # barremos el texto completo como siempre.
+    if events:
+        return events
+
+    # Fallback: barrido del texto completo del body.
     # Patrón visible: "29 enero | 21:00" y justo después el título
     # Ejemplo en la página: :contentReference[oaicite:2]{index=2}
-    events: List[Event] = []
-    i = 0
+    body = tree.body if tree.body is not None else tree.root
+    text = body.text(separator="\n")
 
     # Links de "+ info": los usamos para sacar URL del evento en orden
-    info_links = []
-    for a in soup.select("a"):
-        label = (a.get_text(" ", strip=True) or "").lower()
-        href = a.get("href") or ""
-        if "+ info" in label and href:
-            info_links.append(href)
-
+    info_links = _tempo_info_links(tree)
     info_idx = 0
 
-    while i < len(text_lines):
-        ln = text_lines[i].lower()
-
-        m = re.match(r"^(\d{1,2})\s+([a-záéíóú]+)\s*\|\s*([0-2]?\d:\d{2})$", ln)
-        if m and i + 1 < len(text_lines):
-            day = int(m.group(1))
-            mon = m.group(2)
-            hhmm = m.group(3)
-
-            d0 = parse_spanish_date_str(f"{day} {mon}")
-            if d0:
-                # año real se asignará en main con hoy Madrid: aquí ponemos año placeholder 1900 y luego corregimos fuera,
-                # pero como Event exige date real, la corregimos en caliente con 'datetime.now' Madrid:
-                today_madrid = datetime.now(tz=tz.gettz("Europe/Madrid")).date()
-                d = attach_year(d0, today_madrid)
-
-                title = text_lines[i + 1].strip()
-                url = info_links[info_idx] if info_idx < len(info_links) else source.url
-                if info_idx < len(info_links):
-                    info_idx += 1
-
-                events.append(
-                    Event(
-                        title=title,
-                        venue=source.name,
-                        event_date=d,
-                        event_time=hhmm,
-                        url=url,
-                        source_url=source.url,
-                        raw_genre_text=title,
-                    )
-                )
-            i += 2
+    for m in _TEMPO_EVENT_RE.finditer(text):
+        url = info_links[info_idx] if info_idx < len(info_links) else source.url
+        ev = _tempo_event_from_match(m, url, source, today_madrid)
+        if ev is None:
             continue
+        if info_idx < len(info_links):
+            info_idx += 1
 
-        i += 1
+        events.append(ev)
 
     return events
 
 
-def parse_events_from_cafe_berlin(html: str, source: VenueSource) -> List[Event]:
+def parse_events_from_cafe_berlin(html: str, source: VenueSource, today_madrid: date) -> List[Event]:
     """
     TODO: implementar scraping real.
     """
     return []
 
 
-def parse_events_from_sala_riviera(html: str, source: VenueSource) -> List[Event]:
+def parse_events_from_sala_riviera(html: str, source: VenueSource, today_madrid: date) -> List[Event]:
     """
     TODO: implementar scraping real.
     """
     return []
 
 
-def parse_events(html: str, source: VenueSource) -> List[Event]:
+def parse_events(html: str, source: VenueSource, today_madrid: date) -> List[Event]:
     """
     Router: elige el parser según la fuente.
     (Esto hace el sistema mantenible.)
@@ -255,56 +398,74 @@ def parse_events(html: str, source: VenueSource) -> List[Event]:
     u = source.url.lower()
 
     if "teatrodelbarrio.com" in u:
-        return parse_events_from_teatro_del_barrio(html, source)
+        return parse_events_from_teatro_del_barrio(html, source, today_madrid)
     if "tempoclub.es" in u:
-        return parse_events_from_tempo_club(html, source)
+        return parse_events_from_tempo_club(html, source, today_madrid)
     if "cafeberlinentradas.com" in u:
-        return parse_events_from_cafe_berlin(html, source)
+        return parse_events_from_cafe_berlin(html, source, today_madrid)
     if "salariviera.com" in u:
-        return parse_events_from_sala_riviera(html, source)
+        return parse_events_from_sala_riviera(html, source, today_madrid)
 
     # fallback
     return []
 
 
 # ---------- Pipeline principal ----------
-def collect_events(venues: List[VenueSource]) -> List[Event]:
+async def _collect_events_async(venues: List[VenueSource], today_madrid: date) -> List[Event]:
+    all_events: List[Event] = []
+
+    async with httpx.AsyncClient(
+        http2=True,
+        headers={"User-Agent": USER_AGENT},
+        limits=HTTP_LIMITS,
+        follow_redirects=True,
+    ) as client:
+        tasks = [asyncio.create_task(fetch_html(client, v.url)) for v in venues]
+        for v, task in zip(venues, tasks):
+            try:
+                html = await task
+                events = parse_events(html, v, today_madrid)
+                all_events.extend(events)
+                print(f"[OK] {v.name}: {len(events)} eventos extraídos")
+            except Exception as e:
+                print(f"[ERROR] {v.name}: fallo al obtener/parsear -> {e}")
+
+    # Dedup conservando orden: dos fuentes pueden solapar el mismo evento.
+    return list(dict.fromkeys(all_events))
+
+
+def collect_events(venues: List[VenueSource], today_madrid: date) -> List[Event]:
     """
     Descarga cada fuente y parsea eventos.
+    Las descargas van concurrentes sobre un AsyncClient (son I/O puro);
+    los parsers siguen siendo síncronos, que para estas páginas sobra.
     """
-    all_events: List[Event] = []
-
+    html_venues = []
     for v in venues:
         if v.type != "html":
             print(f"[WARN] Fuente {v.name} es type={v.type}. Aún no soportado en este paso.")
             continue
+        html_venues.append(v)
 
-        try:
-            html = fetch_html(v.url)
-            events = parse_events(html, v)
-            all_events.extend(events)
-            print(f"[OK] {v.name}: {len(events)} eventos extraídos")
-        except Exception as e:
-            print(f"[ERROR] {v.name}: fallo al obtener/parsear -> {e}")
+    if not html_venues:
+        return []
 
-    return all_events
+    return asyncio.run(_collect_events_async(html_venues, today_madrid))
 
 
 def filter_for_this_weekend(events: List[Event], friday: date, saturday: date) -> List[Event]:
     """
     Filtra eventos cuyo event_date sea viernes o sábado (de esa semana).
     """
-    out: List[Event] = []
-    for e in events:
-        if e.event_date in (friday, saturday):
-            out.append(e)
-    return out
+    # Ordinales en un set: una comparación de int por evento, sin pasar
+    # por date.__eq__ dos veces. Escala sin cambios si añadimos más días.
+    target = {friday.toordinal(), saturday.toordinal()}
+    return [e for e in events if e.event_date.toordinal() in target]
 
 
 def main():
     # “Hoy” en zona Madrid (Europe/Madrid)
-    madrid_tz = tz.gettz("Europe/Madrid")
-    now_madrid = datetime.now(tz=madrid_tz)
+    now_madrid = datetime.now(tz=MADRID_TZ)
     today_madrid = now_madrid.date()
 
     friday, saturday = madrid_weekend_window(today_madrid)
@@ -316,7 +477,7 @@ def main():
     print(f"Fuentes cargadas: {len(venues)}")
 
     # 1️⃣ Recoger eventos de todas las webs
-    all_events = collect_events(venues)
+    all_events = collect_events(venues, today_madrid)
 
     # 2️⃣ FILTRO DE FIN DE SEMANA  ⬅️ ESTA LÍNEA FALTABA
     weekend_events = filter_for_this_weekend(all_events, friday, saturday)
@@ -329,9 +490,14 @@ def main():
         if is_danceable(f"{e.title} {e.raw_genre_text}"):
             dance_events.append(e)
 
-    dance_events.sort(
-        key=lambda e: (e.event_date, e.event_time or "99:99", e.venue, e.title)
-    )
+    # Clave precomputada: una tupla por evento en vez de una llamada a
+    # lambda por comparación; el sort queda en comparación C de tuplas.
+    keyed = [
+        ((e.event_date, e.event_time or "99:99", e.venue, e.title), e)
+        for e in dance_events
+    ]
+    keyed.sort(key=itemgetter(0))
+    dance_events = [e for _, e in keyed]
 
     print(f"Eventos viernes/sábado bailables: {len(dance_events)}")
     for e in dance_events[:30]: